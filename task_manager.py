@@ -3,19 +3,33 @@
 The list-of-dicts approach keeps the code lightweight and easy to serialize to
 CSV without introducing external dependencies like pandas. Each row is a task
 record, and each column is a key on the dict, mirroring a spreadsheet model.
+Rows also stay plain dicts rather than slotted row objects: the dict shape is
+part of the public API shared by the scan helpers, ``TaskStore``, the CSV
+helpers and the CLI.
+
+A columnar store (one array per column) would scan faster on very large
+tables, but it would pull in polars/pyarrow and change the row-oriented API the
+CLI and CSV helpers are built around. The scan helpers below are instead kept
+to a single pass over the rows with no per-row parsing where possible.
 """
 
 from __future__ import annotations
 
+from collections import Counter
 import csv
 from datetime import datetime, date
+import sys
 import uuid
 from typing import Dict, List, Optional
 
 
 # Enumerations and schema definitions
-PRIORITIES = ["Low", "Medium", "High", "Urgent"]
-STATUSES = ["To Do", "In Progress", "Blocked", "Completed"]
+PRIORITIES = [sys.intern(p) for p in ["Low", "Medium", "High", "Urgent"]]
+STATUSES = [sys.intern(s) for s in ["To Do", "In Progress", "Blocked", "Completed"]]
+_PRIORITY_RANK = {name: idx for idx, name in enumerate(PRIORITIES)}
+_UNKNOWN_RANK = len(PRIORITIES)
+_PRIORITIES_SET = set(PRIORITIES)
+_STATUSES_SET = set(STATUSES)
 COLUMNS = [
     "task_id",
     "task_name",
@@ -30,30 +44,67 @@ COLUMNS = [
     "notes",
     "last_updated",
 ]
+# Low-cardinality columns whose values are interned so equality checks hit the identity fast path
+_INTERNED_COLUMNS = ("category", "priority", "status")
+_DATE_COLUMNS = ("start_date", "due_date", "completion_date")
+_EMPTY_ROW: Dict[str, Optional[str]] = dict.fromkeys(COLUMNS, None)
 
 
 def _now_iso() -> str:
     return datetime.utcnow().isoformat()
 
 
+def _is_iso_date(date_str: str) -> bool:
+    return (
+        len(date_str) == 10
+        and date_str.isascii()
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:].isdigit()
+    )
+
+
+def _normalize_date(date_str: str) -> str:
+    # Earlier versions accepted unpadded YYYY-M-D (strptime's %m/%d), so pad those
+    # to YYYY-MM-DD; anything else is returned unchanged for validation to reject.
+    if len(date_str) == 10:
+        return date_str
+    parts = date_str.split("-")
+    if (
+        len(parts) == 3
+        and len(parts[0]) == 4
+        and 1 <= len(parts[1]) <= 2
+        and 1 <= len(parts[2]) <= 2
+        and date_str.isascii()
+        and all(part.isdigit() for part in parts)
+    ):
+        return f"{parts[0]}-{parts[1]:0>2}-{parts[2]:0>2}"
+    return date_str
+
+
 def _validate_date(date_str: Optional[str], field_name: str) -> Optional[date]:
     if date_str in (None, ""):
         return None
+    # Fixed YYYY-MM-DD layout parsed by slicing; avoids strptime's format handling.
+    if not _is_iso_date(date_str):
+        raise ValueError(f"{field_name} must be in YYYY-MM-DD format")
     try:
-        parsed = datetime.strptime(date_str, "%Y-%m-%d").date()
-    except ValueError as exc:  # pragma: no cover - defensive
+        parsed = date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    except ValueError as exc:
         raise ValueError(f"{field_name} must be in YYYY-MM-DD format") from exc
     return parsed
 
 
-def _validate_task_record(task: Dict[str, Optional[str]], table: List[Dict[str, Optional[str]]]) -> None:
+def _validate_task_record(task: Dict[str, Optional[str]]) -> None:
     if not task.get("task_name", "").strip():
         raise ValueError("task_name is required")
 
-    if task.get("priority") not in PRIORITIES:
+    if task.get("priority") not in _PRIORITIES_SET:
         raise ValueError(f"priority must be one of {PRIORITIES}")
 
-    if task.get("status") not in STATUSES:
+    if task.get("status") not in _STATUSES_SET:
         raise ValueError(f"status must be one of {STATUSES}")
 
     start = _validate_date(task.get("start_date"), "start_date")
@@ -69,77 +120,178 @@ def _validate_task_record(task: Dict[str, Optional[str]], table: List[Dict[str,
     if completion and start and completion < start:
         raise ValueError("completion_date cannot be before start_date")
 
-    # Enforce unique task_id in the current table
-    ids = [row["task_id"] for row in table]
-    if ids.count(task["task_id"]) > 1:
-        raise ValueError("task_id must be unique")
+
+def _validate_batch(rows: List[Dict[str, Optional[str]]], line_numbers: List[int]) -> None:
+    seen_ids = set()
+    for line_no, row in zip(line_numbers, rows):
+        task_id = row["task_id"]
+        if task_id in seen_ids:
+            raise ValueError(f"Duplicate task_id found in CSV (line {line_no})")
+        seen_ids.add(task_id)
+        try:
+            _validate_task_record(row)
+        except ValueError as exc:
+            raise ValueError(f"line {line_no} (task_id '{task_id}'): {exc}") from exc
 
 
 def _ensure_columns(task: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
-    return {col: task.get(col, None) for col in COLUMNS}
+    row = _EMPTY_ROW.copy()
+    for key, value in task.items():
+        if key in _EMPTY_ROW:
+            row[key] = value
+    for col in _INTERNED_COLUMNS:
+        if isinstance(row[col], str):
+            row[col] = sys.intern(row[col])
+    for col in _DATE_COLUMNS:
+        if isinstance(row[col], str):
+            row[col] = _normalize_date(row[col])
+    return row
+
+
+def _build_task(task_data: Dict[str, Optional[str]], task_id: str) -> Dict[str, Optional[str]]:
+    base_task = _ensure_columns({
+        **task_data,
+        "task_id": task_id,
+        "last_updated": _now_iso(),
+    })
+    _validate_task_record(base_task)
+    return base_task
+
+
+def _merge_task(row: Dict[str, Optional[str]], task_id: str, updates: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+    merged = _ensure_columns({**row, **{k: v for k, v in updates.items() if k in COLUMNS}})
+    merged["task_id"] = task_id
+    merged["last_updated"] = _now_iso()
+    _validate_task_record(merged)
+    return merged
 
 
 def add_task(table: List[Dict[str, Optional[str]]], task_data: Dict[str, Optional[str]]) -> List[Dict[str, Optional[str]]]:
-    new_table = list(table)
+    """Append a validated task to ``table`` in place and return ``table``.
+
+    The list is mutated, not copied, so ``new = add_task(old, ...)`` also
+    changes ``old``; copy it first if the previous version is still needed.
+    The task_id uniqueness check still scans the list, so each call is O(N);
+    use ``TaskStore`` for O(1) inserts.
+    """
     task_id = task_data.get("task_id") or str(uuid.uuid4())
-    if any(row["task_id"] == task_id for row in new_table):
+    if any(row["task_id"] == task_id for row in table):
         raise ValueError("task_id must be unique")
 
-    base_task = _ensure_columns({
-        **task_data,
-        "task_id": task_id,
-        "last_updated": _now_iso(),
-    })
-    _validate_task_record(base_task, new_table + [base_task])
-    new_table.append(base_task)
-    return new_table
+    table.append(_build_task(task_data, task_id))
+    return table
 
 
 def update_task(table: List[Dict[str, Optional[str]]], task_id: str, updates: Dict[str, Optional[str]]) -> List[Dict[str, Optional[str]]]:
+    """Replace the row for ``task_id`` in ``table`` in place and return ``table``.
+
+    As with ``add_task`` the list is mutated, not copied. Finding the row is a
+    linear scan; ``TaskStore.update_task`` looks it up in O(1).
+    """
     if "task_id" in updates and updates["task_id"] != task_id:
         raise ValueError("task_id is immutable")
 
-    new_table = list(table)
-    for idx, row in enumerate(new_table):
+    for idx, row in enumerate(table):
         if row["task_id"] == task_id:
-            merged = _ensure_columns({**row, **{k: v for k, v in updates.items() if k in COLUMNS}})
-            merged["task_id"] = task_id
-            merged["last_updated"] = _now_iso()
-            new_table[idx] = merged
-            _validate_task_record(merged, new_table)
-            return new_table
+            table[idx] = _merge_task(row, task_id, updates)
+            return table
     raise ValueError(f"task_id '{task_id}' not found")
 
 
+class TaskStore:
+    """Task table paired with a ``task_id -> row position`` index.
+
+    ``add_task``/``update_task`` on a plain list have to scan every row to find
+    a task; the store keeps the index alongside the rows so both are O(1).
+    It also keeps a running count per status so progress needs no scan.
+    Rows passed to the constructor are validated like any added task unless
+    ``validate`` is false, for rows that were already checked (for example the
+    output of ``import_from_csv``).
+    """
+
+    def __init__(self, rows: Optional[List[Dict[str, Optional[str]]]] = None, validate: bool = True) -> None:
+        self.rows: List[Dict[str, Optional[str]]] = []
+        self.index: Dict[str, int] = {}
+        self.status_counts: Counter = Counter()
+        for row in rows or []:
+            if row["task_id"] in self.index:
+                raise ValueError("task_id must be unique")
+            if validate:
+                _validate_task_record(row)
+            self.index[row["task_id"]] = len(self.rows)
+            self.rows.append(row)
+            self.status_counts[row["status"]] += 1
+
+    def add_task(self, task_data: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+        task_id = task_data.get("task_id") or str(uuid.uuid4())
+        if task_id in self.index:
+            raise ValueError("task_id must be unique")
+
+        base_task = _build_task(task_data, task_id)
+        self.index[task_id] = len(self.rows)
+        self.rows.append(base_task)
+        self.status_counts[base_task["status"]] += 1
+        return base_task
+
+    def update_task(self, task_id: str, updates: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+        if "task_id" in updates and updates["task_id"] != task_id:
+            raise ValueError("task_id is immutable")
+
+        idx = self.index.get(task_id)
+        if idx is None:
+            raise ValueError(f"task_id '{task_id}' not found")
+
+        merged = _merge_task(self.rows[idx], task_id, updates)
+        self.status_counts[self.rows[idx]["status"]] -= 1
+        self.status_counts[merged["status"]] += 1
+        self.rows[idx] = merged
+        return merged
+
+    def progress_percentage(self) -> float:
+        return _progress(self.status_counts["Completed"], len(self.rows))
+
+
 def filter_tasks(
     table: List[Dict[str, Optional[str]]],
     status: Optional[str] = None,
     category: Optional[str] = None,
     assigned_to: Optional[str] = None,
 ) -> List[Dict[str, Optional[str]]]:
-    def _matches(row: Dict[str, Optional[str]]) -> bool:
-        if status and row.get("status") != status:
-            return False
-        if category and row.get("category") != category:
-            return False
-        if assigned_to and row.get("assigned_to") != assigned_to:
-            return False
-        return True
-
-    return [row for row in table if _matches(row)]
+    # Only compare the filters that are set, with a straight-line predicate per shape.
+    preds = []
+    if status:
+        preds.append(("status", sys.intern(status) if isinstance(status, str) else status))
+    if category:
+        preds.append(("category", sys.intern(category) if isinstance(category, str) else category))
+    if assigned_to:
+        preds.append(("assigned_to", assigned_to))
+
+    if not preds:
+        return list(table)
+    if len(preds) == 1:
+        ((k1, v1),) = preds
+        return [row for row in table if row.get(k1) == v1]
+    if len(preds) == 2:
+        (k1, v1), (k2, v2) = preds
+        return [row for row in table if row.get(k1) == v1 and row.get(k2) == v2]
+    (k1, v1), (k2, v2), (k3, v3) = preds
+    return [row for row in table if row.get(k1) == v1 and row.get(k2) == v2 and row.get(k3) == v3]
 
 
 def sort_tasks_by_priority_and_due_date(table: List[Dict[str, Optional[str]]]) -> List[Dict[str, Optional[str]]]:
-    priority_rank = {name: idx for idx, name in enumerate(PRIORITIES)}
-
-    def _due_key(row: Dict[str, Optional[str]]):
-        due = _validate_date(row.get("due_date"), "due_date")
-        return due or date.max
-
-    return sorted(
-        table,
-        key=lambda row: (priority_rank.get(row.get("priority"), len(PRIORITIES)), _due_key(row)),
-    )
+    # Decorate-sort-undecorate: parse each due_date once instead of per comparison.
+    # The row position breaks ties so rows themselves are never compared.
+    decorated = [
+        (
+            _PRIORITY_RANK.get(row.get("priority"), _UNKNOWN_RANK),
+            _validate_date(row.get("due_date"), "due_date") or date.max,
+            idx,
+            row,
+        )
+        for idx, row in enumerate(table)
+    ]
+    decorated.sort()
+    return [item[3] for item in decorated]
 
 
 def get_tasks(
@@ -168,46 +320,62 @@ def overdue_tasks(table: List[Dict[str, Optional[str]]], today: Optional[date] =
     today = today or date.today()
     overdue = []
     for row in table:
-        due = _validate_date(row.get("due_date"), "due_date")
+        due = row.get("due_date")
         if not due:
             continue
-        if due < today and row.get("status") != "Completed":
+        # date.fromisoformat is implemented in C and rejects impossible dates
+        # such as 2024-02-30, which a plain string comparison would let through.
+        try:
+            due_date = date.fromisoformat(due)
+        except ValueError as exc:
+            raise ValueError("due_date must be in YYYY-MM-DD format") from exc
+        if due_date < today and row.get("status") != "Completed":
             overdue.append(row)
     return overdue
 
 
-def progress_percentage(table: List[Dict[str, Optional[str]]]) -> float:
-    if not table:
+def _progress(completed: int, total: int) -> float:
+    if not total:
         return 0.0
-    completed = sum(1 for row in table if row.get("status") == "Completed")
-    return round((completed / len(table)) * 100, 2)
+    return round((completed / total) * 100, 2)
+
+
+def progress_percentage(table: List[Dict[str, Optional[str]]]) -> float:
+    return _progress(sum(1 for row in table if row.get("status") == "Completed"), len(table))
 
 
 def export_to_csv(table: List[Dict[str, Optional[str]]], path: str) -> None:
     with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=COLUMNS)
-        writer.writeheader()
-        for row in table:
-            writer.writerow({col: row.get(col, "") or "" for col in COLUMNS})
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows([row.get(col) or "" for col in COLUMNS] for row in table)
 
 
 def import_from_csv(path: str) -> List[Dict[str, Optional[str]]]:
     new_table: List[Dict[str, Optional[str]]] = []
+    line_numbers: List[int] = []
+    # Rows imported together share one timestamp
+    batch_now = _now_iso()
     with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        if reader.fieldnames != COLUMNS:
+        reader = csv.reader(f)
+        if next(reader, None) != COLUMNS:
             raise ValueError("CSV columns do not match expected schema")
-        for row in reader:
-            cleaned = {col: (row.get(col) or None) for col in COLUMNS}
-            if any(existing["task_id"] == cleaned["task_id"] for existing in new_table):
-                raise ValueError("Duplicate task_id found in CSV")
-            cleaned["last_updated"] = cleaned.get("last_updated") or _now_iso()
-            _validate_task_record(cleaned, new_table + [cleaned])
+        for values in reader:
+            if not values:
+                continue
+            cleaned = _ensure_columns({col: (value or None) for col, value in zip(COLUMNS, values)})
+            cleaned["last_updated"] = cleaned["last_updated"] or batch_now
             new_table.append(cleaned)
+            line_numbers.append(reader.line_num)
+    _validate_batch(new_table, line_numbers)
     return new_table
 
 
 # --------------------------- CLI Utilities ---------------------------
+def _cell(value: object) -> str:
+    return value if isinstance(value, str) else str(value or "")
+
+
 def _print_tasks(table: List[Dict[str, Optional[str]]]) -> None:
     if not table:
         print("No tasks to display.")
@@ -224,25 +392,29 @@ def _print_tasks(table: List[Dict[str, Optional[str]]]) -> None:
         "category",
         "last_updated",
     ]
-    widths = {col: max(len(col), *(len(str(row.get(col, ""))) for row in table)) for col in columns_to_show}
-    header = " | ".join(col.ljust(widths[col]) for col in columns_to_show)
+    cells = [[_cell(row.get(col)) for col in columns_to_show] for row in table]
+    widths = [max(map(len, column)) for column in zip(*cells)]
+    # Columns with no values in any row are left out entirely
+    shown = [idx for idx, width in enumerate(widths) if width]
+    fmt = " | ".join(f"{{:<{max(widths[idx], len(columns_to_show[idx]))}}}" for idx in shown)
+    header = fmt.format(*(columns_to_show[idx] for idx in shown))
     print(header)
     print("-" * len(header))
-    for row in table:
-        line = " | ".join(str(row.get(col, "") or "").ljust(widths[col]) for col in columns_to_show)
-        print(line)
+    for row_cells in cells:
+        print(fmt.format(*(row_cells[idx] for idx in shown)))
 
 
 def _input_date(prompt: str) -> Optional[str]:
     value = input(prompt).strip()
     if not value:
         return None
+    value = _normalize_date(value)
     _validate_date(value, prompt.strip(": "))
     return value
 
 
 def cli_loop() -> None:
-    table: List[Dict[str, Optional[str]]] = []
+    store = TaskStore()
     while True:
         print(
             """
@@ -273,7 +445,7 @@ Task Manager
                     "assigned_to": input("Assigned to (optional): ").strip() or None,
                     "notes": input("Notes: ").strip(),
                 }
-                table = add_task(table, task_data)
+                store.add_task(task_data)
                 print("Task added.\n")
 
             elif choice == "2":
@@ -288,7 +460,7 @@ Task Manager
                     val = _input_date(f"{field} (YYYY-MM-DD): ")
                     if val is not None:
                         updates[field] = val
-                table = update_task(table, task_id, updates)
+                store.update_task(task_id, updates)
                 print("Task updated.\n")
 
             elif choice == "3":
@@ -300,24 +472,24 @@ Task Manager
                 }
                 sort_choice = input("Sort by priority & due date? (y/N): ").strip().lower()
                 sort_key = "priority_due" if sort_choice == "y" else None
-                filtered = get_tasks(table, filters={k: v for k, v in filters.items() if v}, sort_by=sort_key)
+                filtered = get_tasks(store.rows, filters={k: v for k, v in filters.items() if v}, sort_by=sort_key)
                 _print_tasks(filtered)
 
             elif choice == "4":
-                overdue = overdue_tasks(table)
+                overdue = overdue_tasks(store.rows)
                 _print_tasks(overdue)
 
             elif choice == "5":
-                print(f"Progress: {progress_percentage(table)}%\n")
+                print(f"Progress: {store.progress_percentage()}%\n")
 
             elif choice == "6":
                 path = input("Export CSV path: ").strip()
-                export_to_csv(table, path)
+                export_to_csv(store.rows, path)
                 print(f"Exported to {path}.\n")
 
             elif choice == "7":
                 path = input("Import CSV path: ").strip()
-                table = import_from_csv(path)
+                store = TaskStore(import_from_csv(path), validate=False)
                 print("Imported tasks.\n")
 
             elif choice == "0":